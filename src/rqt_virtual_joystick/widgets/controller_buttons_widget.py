@@ -4,14 +4,20 @@ from dataclasses import dataclass
 from enum import IntEnum
 from typing import Dict, Set, Tuple
 
-from python_qt_binding.QtCore import Qt, QSize, QPoint, pyqtSignal
+from python_qt_binding.QtCore import Qt, QEvent, QSize, QPoint, QPointF, QRect, pyqtSignal
 from python_qt_binding.QtGui import (
     QColor,
     QPainter,
     QPen,
     QBrush,
     QRadialGradient,
+    QRegion,
     QFont,
+    QFontMetrics,
+    QImage,
+    QPixmap,
+    QStaticText,
+    QTransform,
 )
 from python_qt_binding.QtWidgets import QAbstractButton, QGridLayout, QSizePolicy, QWidget
 
@@ -23,20 +29,16 @@ class GameButton(IntEnum):
     Y = 3
 
 
-LABELS: Dict[GameButton, str] = {
-    GameButton.A: "A",
-    GameButton.B: "B",
-    GameButton.X: "X",
-    GameButton.Y: "Y",
-}
+# Indexed by GameButton value (A, B, X, Y).
+LABELS: Tuple[str, ...] = ("A", "B", "X", "Y")
 
 
-COLORS: Dict[GameButton, QColor] = {
-    GameButton.A: QColor(120, 255, 120),  # Green
-    GameButton.B: QColor(255, 100, 100),  # Red
-    GameButton.X: QColor(100, 150, 255),  # Blue
-    GameButton.Y: QColor(255, 220, 100),  # Yellow
-}
+COLORS: Tuple[QColor, ...] = (
+    QColor(120, 255, 120),  # A: Green
+    QColor(255, 100, 100),  # B: Red
+    QColor(100, 150, 255),  # X: Blue
+    QColor(255, 220, 100),  # Y: Yellow
+)
 
 
 BUTTON_LAYOUT: Tuple[Tuple[GameButton, int, int], ...] = (
@@ -47,46 +49,124 @@ BUTTON_LAYOUT: Tuple[Tuple[GameButton, int, int], ...] = (
 )
 
 
+# Paint constants shared by every button; built once instead of per paint.
+_SHADOW_COLOR = QColor(0, 0, 0, 60)
+_HIGHLIGHT_COLOR = QColor(255, 255, 255, 80)
+_FOCUS_COLOR = QColor(255, 255, 255, 180)
+_GLOW_COLOR = QColor(255, 255, 255, 160)
+_WHITE_PEN = QPen(QColor(255, 255, 255), 1)
+_FOCUS_PEN = QPen(_FOCUS_COLOR, 2, Qt.DotLine)
+_SHADOW_BRUSH = QBrush(_SHADOW_COLOR)
+_HIGHLIGHT_BRUSH = QBrush(_HIGHLIGHT_COLOR)
+
+_BG_SHADOW_OFFSET = 3
+
+_BUTTON_FONT = QFont()
+_BUTTON_FONT.setPointSize(15)
+_BUTTON_FONT.setBold(True)
+
+
 @dataclass
 class ButtonStyle:
-    base: QColor
-    border_pen: QPen
+    border_pen_unpressed: QPen
+    border_pen_pressed: QPen
     ring_pen: QPen
     font: QFont
+    # Gradient prototypes built around a unit center; only the center and
+    # radius are updated at paint time.
+    body_gradient_unpressed: QRadialGradient
+    body_gradient_pressed: QRadialGradient
+    glow_gradient: QRadialGradient
 
 
 def _build_style(base_color: QColor) -> ButtonStyle:
-    border_pen = QPen(base_color.darker(150), 2)
+    base_darker_110 = base_color.darker(110)
+    base_darker_130 = base_color.darker(130)
+    base_darker_150 = base_color.darker(150)
+    base_darker_180 = base_color.darker(180)
+    base_lighter_150 = base_color.lighter(150)
+
+    border_pen_unpressed = QPen(base_darker_150, 2)
+    border_pen_pressed = QPen(base_darker_180, 2)
     ring_pen = QPen(base_color.lighter(170), 3)
     ring_pen.setJoinStyle(Qt.RoundJoin)
 
-    font = QFont()
-    font.setPointSize(15)
-    font.setBold(True)
+    body_gradient_unpressed = QRadialGradient(QPointF(0, 0), 1)
+    body_gradient_unpressed.setColorAt(0.0, base_lighter_150)
+    body_gradient_unpressed.setColorAt(0.5, base_color)
+    body_gradient_unpressed.setColorAt(1.0, base_color.darker(120))
+
+    body_gradient_pressed = QRadialGradient(QPointF(0, 0), 1)
+    body_gradient_pressed.setColorAt(0.0, base_darker_130)
+    body_gradient_pressed.setColorAt(0.7, base_darker_110)
+    body_gradient_pressed.setColorAt(1.0, base_darker_150)
+
+    glow_gradient = QRadialGradient(QPointF(0, 0), 1)
+    glow_gradient.setColorAt(0.0, _GLOW_COLOR)
+    glow_gradient.setColorAt(0.5, base_lighter_150)
+    glow_gradient.setColorAt(1.0, QColor(base_color.red(), base_color.green(), base_color.blue(), 0))
 
     return ButtonStyle(
-        base=base_color,
-        border_pen=border_pen,
+        border_pen_unpressed=border_pen_unpressed,
+        border_pen_pressed=border_pen_pressed,
         ring_pen=ring_pen,
-        font=font,
+        font=_BUTTON_FONT,
+        body_gradient_unpressed=body_gradient_unpressed,
+        body_gradient_pressed=body_gradient_pressed,
+        glow_gradient=glow_gradient,
     )
 
 
+def _place_gradient(gradient: QRadialGradient, x: float, y: float, radius: float) -> QRadialGradient:
+    """Move a cached gradient prototype to ``(x, y)`` with the given radius."""
+    gradient.setCenter(x, y)
+    gradient.setFocalPoint(x, y)
+    gradient.setCenterRadius(radius)
+    return gradient
+
+
+# Per-button styles indexed by GameButton value, shared by every instance.
+_STYLES: Tuple[ButtonStyle, ...] = tuple(_build_style(color) for color in COLORS)
+
+
 class ControllerButton(QAbstractButton):
     """Controller face button with optional sticky (toggle) mode."""
 
+    # Rendered buttons keyed by (id, width, height, device pixel ratio,
+    # pressed, focused); the vector primitives are only rasterized on the
+    # first paint of each state at each screen resolution.
+    _image_cache: Dict[Tuple[int, int, int, float, bool, bool], QImage] = {}
+
     def __init__(self, btn_id: GameButton, parent: QWidget | None = None):
         super().__init__(parent)
         self._id = btn_id
-        self._style = _build_style(COLORS[btn_id])
+        self._label = LABELS[int(btn_id)]
+        self._style = _STYLES[int(btn_id)]
+        # Label and font never change, so lay the label out once.
+        self._static_label = QStaticText(self._label)
+        self._static_label.setTextFormat(Qt.PlainText)
+        self._static_label.prepare(QTransform(), self._style.font)
+        label_size = self._static_label.size()
+        ascent = QFontMetrics(self._style.font).ascent()
+        # Offset from the button center to the label's top-left corner.
+        self._label_dx = -(int(label_size.width()) // 2)
+        self._label_dy = int(label_size.height()) // 2 - 2 - ascent
+        # Gradient brushes for the current (cx, cy, radius); QBrush copies its
+        # gradient, so they are rebuilt only when that geometry changes.
+        self._brush_geometry: Tuple[int, int, int] | None = None
+        self._body_brush_unpressed = QBrush()
+        self._body_brush_pressed = QBrush()
+        self._glow_brush = QBrush()
+        self._last_paint_key: Tuple[int, int, int, float, bool, bool] | None = None
+        self._last_image: QImage | None = None
         self._sticky = False
 
         self.setCheckable(True)
         self.setChecked(False)
         self.setCursor(Qt.PointingHandCursor)
         self.setFocusPolicy(Qt.StrongFocus)
-        # self.setAccessibleName(f"Controller button {LABELS[btn_id]}")
-        self.setToolTip(LABELS[btn_id])
+        # self.setAccessibleName(f"Controller button {self._label}")
+        self.setToolTip(self._label)
 
         # Momentary behaviour uses pressed/released to mirror legacy semantics.
         self.pressed.connect(self._on_pressed)
@@ -107,119 +187,182 @@ class ControllerButton(QAbstractButton):
         if self._sticky:
             super().nextCheckState()
 
+    def focusInEvent(self, event) -> None:  # type: ignore[override]
+        # The base handlers end in QWidget's full update(), but focus only
+        # toggles the ring. QAbstractButton's focus-policy fixup is skipped;
+        # it only matters for auto-exclusive buttons.
+        self.update(self._focus_ring_region())
+
+    def focusOutEvent(self, event) -> None:  # type: ignore[override]
+        # Mirror QAbstractButton: losing focus (other than to a popup) cancels
+        # a held press and emits released(), which momentary mode relies on
+        # to uncheck the button. setDown() repaints the whole button itself.
+        if event.reason() != Qt.PopupFocusReason and self.isDown():
+            self.setDown(False)
+            self.released.emit()
+        self.update(self._focus_ring_region())
+
     def paintEvent(self, event) -> None:  # type: ignore[override]
+        pressed = self.isDown() or self.isChecked()
+        ratio = self.devicePixelRatioF()
+        key = (int(self._id), self.width(), self.height(), ratio, pressed, self.hasFocus())
+        if key == self._last_paint_key and self._last_image is not None:
+            # State unchanged since the last paint (sibling focus, polish,
+            # parent updates): reuse the image without a cache lookup.
+            image = self._last_image
+        else:
+            image = self._image_cache.get(key)
+            if image is None:
+                image = self._render_image(pressed, ratio)
+                ControllerButton._image_cache[key] = image
+            self._last_paint_key = key
+            self._last_image = image
+
         painter = QPainter(self)
+        painter.setClipRect(event.rect())
+        painter.drawImage(0, 0, image)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._last_paint_key = None
+        self._last_image = None
+        # Entries for other ratios at the new size stay valid for other screens.
+        btn_id = int(self._id)
+        width = event.size().width()
+        height = event.size().height()
+        stale = [
+            key for key in self._image_cache
+            if key[0] == btn_id and (key[1] != width or key[2] != height)
+        ]
+        for key in stale:
+            del ControllerButton._image_cache[key]
+
+    def _render_image(self, pressed: bool, ratio: float) -> QImage:
+        # Premultiplied ARGB is the raster engine's native format, the
+        # cheapest target to render into and to blit from.
+        image = QImage(self.size() * ratio, QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        center = QPoint(self.width() // 2, self.height() // 2)
+        cx = self.width() // 2
+        cy = self.height() // 2
         radius = max(0, min(self.width(), self.height()) // 2 - 2)
-        pressed = self.isDown() or self.isChecked()
+        self._update_gradient_brushes(cx, cy, radius)
 
-        self._draw_shadow(painter, center, radius, pressed)
-        self._draw_body(painter, center, radius, pressed)
-        self._draw_highlight(painter, center, radius, pressed)
+        self._draw_shadow(painter, cx, cy, radius, pressed)
+        self._draw_body(painter, cx, cy, radius, pressed)
+        self._draw_highlight(painter, cx, cy, radius, pressed)
         if pressed:
-            self._draw_pressed_overlay(painter, center, radius)
-        self._draw_focus_ring(painter, center, radius)
-        self._draw_text(painter, center, pressed)
+            self._draw_pressed_overlay(painter, cx, cy, radius)
+        self._draw_focus_ring(painter, cx, cy, radius)
+        self._draw_text(painter, cx, cy, pressed)
+        painter.end()
+        return image
+
+    def _update_gradient_brushes(self, cx: int, cy: int, radius: int) -> None:
+        geometry = (cx, cy, radius)
+        if geometry == self._brush_geometry:
+            return
+        self._brush_geometry = geometry
+        style = self._style
+        self._body_brush_pressed = QBrush(_place_gradient(style.body_gradient_pressed, cx + 2, cy + 2, radius))
+        self._body_brush_unpressed = QBrush(_place_gradient(style.body_gradient_unpressed, cx - 3, cy - 3, radius))
+        inner_radius = max(0, radius - 5)
+        self._glow_brush = QBrush(_place_gradient(style.glow_gradient, cx + 1, cy + 1, inner_radius))
+
+    def _focus_ring_region(self) -> QRegion:
+        """Annulus covered by the focus ring, padded for pen width and AA."""
+        cx = self.width() // 2
+        cy = self.height() // 2
+        radius = max(0, min(self.width(), self.height()) // 2 - 2)
+        # The ring is stroked at radius + 2 with a 2px pen.
+        outer = radius + 4
+        inner = max(0, radius - 1)
+        outer_region = QRegion(cx - outer, cy - outer, 2 * outer, 2 * outer, QRegion.Ellipse)
+        inner_region = QRegion(cx - inner, cy - inner, 2 * inner, 2 * inner, QRegion.Ellipse)
+        return outer_region.subtracted(inner_region)
 
     # ------------------------------------------------------------------
     # Painting primitives
     # ------------------------------------------------------------------
+    # Helpers do not save/restore the painter; each one sets the pen and
+    # brush (and font, for text) it draws with and leaves them changed.
 
-    def _draw_shadow(self, painter: QPainter, center: QPoint, radius: int, pressed: bool) -> None:
+    def _draw_shadow(self, painter: QPainter, cx: int, cy: int, radius: int, pressed: bool) -> None:
         if pressed or radius <= 0:
             return
-        painter.save()
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(0, 0, 0, 60)))
+        painter.setBrush(_SHADOW_BRUSH)
         shadow_offset = 2
-        shadow_center = QPoint(center.x() + shadow_offset, center.y() + shadow_offset)
-        painter.drawEllipse(shadow_center, radius + 1, radius + 1)
-        painter.restore()
+        shadow_radius = radius + 1
+        painter.drawEllipse(
+            cx + shadow_offset - shadow_radius,
+            cy + shadow_offset - shadow_radius,
+            2 * shadow_radius,
+            2 * shadow_radius,
+        )
 
-    def _draw_body(self, painter: QPainter, center: QPoint, radius: int, pressed: bool) -> None:
-        painter.save()
-        gradient_center = QPoint(center)
+    def _draw_body(self, painter: QPainter, cx: int, cy: int, radius: int, pressed: bool) -> None:
         if pressed:
-            gradient_center += QPoint(2, 2)
-            gradient = QRadialGradient(gradient_center, radius)
-            gradient.setColorAt(0.0, self._style.base.darker(130))
-            gradient.setColorAt(0.7, self._style.base.darker(110))
-            gradient.setColorAt(1.0, self._style.base.darker(150))
-            pen_color = self._style.base.darker(180)
+            painter.setBrush(self._body_brush_pressed)
+            painter.setPen(self._style.border_pen_pressed)
+            cx += 1
+            cy += 1
         else:
-            gradient_center += QPoint(-3, -3)
-            gradient = QRadialGradient(gradient_center, radius)
-            gradient.setColorAt(0.0, self._style.base.lighter(150))
-            gradient.setColorAt(0.5, self._style.base)
-            gradient.setColorAt(1.0, self._style.base.darker(120))
-            pen_color = self._style.base.darker(150)
-
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(QPen(pen_color, self._style.border_pen.width()))
-        draw_center = QPoint(center)
-        if pressed:
-            draw_center += QPoint(1, 1)
-        painter.drawEllipse(draw_center, radius, radius)
-        painter.restore()
+            painter.setBrush(self._body_brush_unpressed)
+            painter.setPen(self._style.border_pen_unpressed)
+        painter.drawEllipse(cx - radius, cy - radius, 2 * radius, 2 * radius)
 
-    def _draw_highlight(self, painter: QPainter, center: QPoint, radius: int, pressed: bool) -> None:
+    def _draw_highlight(self, painter: QPainter, cx: int, cy: int, radius: int, pressed: bool) -> None:
         if pressed:
             return
         highlight_radius = radius - 6
         if highlight_radius <= 0:
             return
-        painter.save()
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(255, 255, 255, 80)))
-        highlight_center = QPoint(center.x() - 2, center.y() - 2)
-        painter.drawEllipse(highlight_center, highlight_radius, highlight_radius)
-        painter.restore()
-
-    def _draw_pressed_overlay(self, painter: QPainter, center: QPoint, radius: int) -> None:
-        painter.save()
-        draw_center = QPoint(center.x() + 1, center.y() + 1)
+        painter.setBrush(_HIGHLIGHT_BRUSH)
+        painter.drawEllipse(
+            cx - 2 - highlight_radius,
+            cy - 2 - highlight_radius,
+            2 * highlight_radius,
+            2 * highlight_radius,
+        )
+
+    def _draw_pressed_overlay(self, painter: QPainter, cx: int, cy: int, radius: int) -> None:
+        cx += 1
+        cy += 1
         inner_radius = max(0, radius - 5)
         if inner_radius > 0:
-            glow = QRadialGradient(draw_center, inner_radius)
-            glow.setColorAt(0.0, QColor(255, 255, 255, 160))
-            glow.setColorAt(0.5, self._style.base.lighter(150))
-            glow.setColorAt(1.0, QColor(self._style.base.red(), self._style.base.green(), self._style.base.blue(), 0))
-            painter.setBrush(QBrush(glow))
+            painter.setBrush(self._glow_brush)
             painter.setPen(Qt.NoPen)
-            painter.drawEllipse(draw_center, inner_radius, inner_radius)
+            painter.drawEllipse(cx - inner_radius, cy - inner_radius, 2 * inner_radius, 2 * inner_radius)
 
         painter.setBrush(Qt.NoBrush)
         painter.setPen(self._style.ring_pen)
-        painter.drawEllipse(draw_center, radius, radius)
-        painter.restore()
+        painter.drawEllipse(cx - radius, cy - radius, 2 * radius, 2 * radius)
 
-    def _draw_focus_ring(self, painter: QPainter, center: QPoint, radius: int) -> None:
+    def _draw_focus_ring(self, painter: QPainter, cx: int, cy: int, radius: int) -> None:
         if not self.hasFocus() or radius <= 0:
             return
-        painter.save()
-        focus_pen = QPen(QColor(255, 255, 255, 180), 2, Qt.DotLine)
         painter.setBrush(Qt.NoBrush)
-        painter.setPen(focus_pen)
-        painter.drawEllipse(center, radius + 2, radius + 2)
-        painter.restore()
+        painter.setPen(_FOCUS_PEN)
+        ring_radius = radius + 2
+        painter.drawEllipse(cx - ring_radius, cy - ring_radius, 2 * ring_radius, 2 * ring_radius)
 
-    def _draw_text(self, painter: QPainter, center: QPoint, pressed: bool) -> None:
-        painter.save()
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
+    def _draw_text(self, painter: QPainter, cx: int, cy: int, pressed: bool) -> None:
+        painter.setPen(_WHITE_PEN)
         painter.setBrush(Qt.NoBrush)
         painter.setFont(self._style.font)
 
-        label = LABELS[self._id]
-        rect = painter.fontMetrics().boundingRect(label)
-        offset = QPoint(1, 1) if pressed else QPoint(0, 0)
-        text_pos = QPoint(
-            center.x() - rect.width() // 2 + offset.x(),
-            center.y() + rect.height() // 2 - 2 + offset.y(),
+        offset = 1 if pressed else 0
+        painter.drawStaticText(
+            cx + self._label_dx + offset,
+            cy + self._label_dy + offset,
+            self._static_label,
         )
-        painter.drawText(text_pos, label)
-        painter.restore()
 
     # ------------------------------------------------------------------
     # Behaviour helpers
@@ -233,35 +376,49 @@ class ControllerButton(QAbstractButton):
         self.setDown(False)
 
     def set_sticky(self, enabled: bool) -> None:
-        self._sticky = bool(enabled)
+        enabled = bool(enabled)
+        # The momentary slots are connected exactly while not sticky, so they
+        # need no mode check of their own.
+        if enabled != self._sticky:
+            if enabled:
+                self.pressed.disconnect(self._on_pressed)
+                self.released.disconnect(self._on_released)
+            else:
+                self.pressed.connect(self._on_pressed)
+                self.released.connect(self._on_released)
+        self._sticky = enabled
         if not self._sticky:
             self.setChecked(False)
 
     def _on_pressed(self) -> None:
-        if not self._sticky:
-            if not self.isChecked():
-                self.setChecked(True)
+        if not self.isChecked():
+            self.setChecked(True)
 
     def _on_released(self) -> None:
-        if not self._sticky:
-            if self.isChecked():
-                self.setChecked(False)
+        if self.isChecked():
+            self.setChecked(False)
 
 
 class ControllerButtonsWidget(QWidget):
     """Group of controller buttons arranged in a diamond layout."""
 
     button_toggled = pyqtSignal(int, bool)
-    button_state_changed = pyqtSignal(int, bool)  # emits toggled state
 
     def __init__(self, parent: QWidget | None = None, sticky_buttons: bool = False):
         super().__init__(parent)
+        # Deprecated: same payload as button_toggled; connect to that instead.
+        self.button_state_changed = self.button_toggled
         self._layout = QGridLayout(self)
         self._layout.setSpacing(2)
         self._layout.setContentsMargins(8, 8, 8, 8)
 
         self._buttons: Dict[GameButton, ControllerButton] = {}
         self._pressed: Set[GameButton] = set()
+        self._resetting = False
+        # Static background disc, rendered lazily and dropped on resize,
+        # palette change or a device pixel ratio change.
+        self._bg_pixmap: QPixmap | None = None
+        self._disc_rect = QRect()
 
         self._init_ui()
         self.set_sticky_buttons(sticky_buttons)
@@ -278,7 +435,7 @@ class ControllerButtonsWidget(QWidget):
 
         for btn_id, row, column in BUTTON_LAYOUT:
             button = ControllerButton(btn_id, self)
-            button.setText(LABELS[btn_id])
+            button.setText(LABELS[int(btn_id)])
             button.toggled.connect(lambda checked, b=btn_id: self._on_button_toggled(b, checked))
 
             if btn_id == GameButton.B:
@@ -294,28 +451,63 @@ class ControllerButtonsWidget(QWidget):
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
+        # Re-render after moving to a screen with a different pixel ratio.
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._render_background()
+
+        # Only the disc is painted; skip exposes that fall entirely outside it.
+        dirty = event.rect()
+        if not dirty.intersects(self._disc_rect):
+            return
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipRect(dirty)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._bg_pixmap = None
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        if event.type() == QEvent.PaletteChange:
+            self._bg_pixmap = None
+            self.update()
 
+    def _render_background(self) -> None:
         width = self.width()
         height = self.height()
         size = min(width, height)
         center = QPoint(width // 2, height // 2)
         radius = max(0, size // 2 - 10)
+        # Disc plus its 1px pen overhang and the shadow reaching down-right.
+        extent = 2 * (radius + _BG_SHADOW_OFFSET)
+        self._disc_rect = QRect(center.x() - radius - 1, center.y() - radius - 1, extent + 2, extent + 2)
+
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
         self._draw_background(painter, center, radius)
+        painter.end()
+        self._bg_pixmap = pixmap
 
     def _draw_background(self, painter: QPainter, center: QPoint, radius: int) -> None:
         if radius <= 0:
             return
 
-        shadow_offset = 3
+        # Shares the disc's top-left corner but is 2 * offset larger, so it
+        # peeks out only along the bottom-right edge.
         painter.setPen(Qt.NoPen)
         painter.setBrush(QBrush(QColor(0, 0, 0, 80)))
         painter.drawEllipse(
-            center.x() - radius - shadow_offset + shadow_offset,
-            center.y() - radius - shadow_offset + shadow_offset,
-            (radius + shadow_offset) * 2,
-            (radius + shadow_offset) * 2,
+            center.x() - radius,
+            center.y() - radius,
+            2 * (radius + _BG_SHADOW_OFFSET),
+            2 * (radius + _BG_SHADOW_OFFSET),
         )
 
         gradient = QRadialGradient(center, radius)
@@ -366,16 +558,21 @@ class ControllerButtonsWidget(QWidget):
                 button.reset()
             return
 
-        # copy to avoid mutation during iteration when setChecked emits
-        for btn_id in list(self._pressed):
-            self.set_button_checked(btn_id, False)
-        self._pressed.clear()
+        # Toggle slots still emit but leave _pressed alone while resetting,
+        # so the set is never mutated mid-loop and is cleared in one pass.
+        self._resetting = True
+        try:
+            for button in self._buttons.values():
+                button.setChecked(False)
+            self._pressed.clear()
+        finally:
+            self._resetting = False
 
     def _on_button_toggled(self, btn_id: GameButton, checked: bool) -> None:
-        if checked:
-            self._pressed.add(btn_id)
-        else:
-            self._pressed.discard(btn_id)
+        if not self._resetting:
+            if checked:
+                self._pressed.add(btn_id)
+            else:
+                self._pressed.discard(btn_id)
         index = int(btn_id)
         self.button_toggled.emit(index, checked)
-        self.button_state_changed.emit(index, checked)